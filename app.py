@@ -28,8 +28,8 @@ from logic import (
     BIOTIPO_WEIGHTS,
     BIOTIPO_TIPS,
 )
-from figures import create_biotipos_figure
-from export import generate_csv, generate_pdf
+from figures import create_biotipos_figure, biotipos_png_bytes
+from export import csv_stream, submit_pdf
 
 # Configure the page
 st.set_page_config(
@@ -47,17 +47,28 @@ if "result_data" not in st.session_state:
 if "inputs" not in st.session_state:
     st.session_state["inputs"] = {}
 
-# Sidebar navigation
+def _goto(page: str) -> None:
+    """Button callback: switch pages before the next natural rerun.
+
+    Callbacks run ahead of the script body, so the router below already
+    sees the new page on the rerun triggered by the click – no explicit
+    ``st.experimental_rerun`` (and hence no second full script execution)
+    is needed.
+    """
+    st.session_state["page"] = page
+
+def _on_nav() -> None:
+    """Sidebar callback: reset the result when navigating away from it."""
+    if st.session_state["page"] != "Resultado":
+        st.session_state["result_data"] = None
+
+# Sidebar navigation.  The radio is bound directly to the "page" session
+# state key, so Streamlit propagates selection changes itself instead of
+# the manual assign-and-rerun pair used previously.
 pages = ["Início", "Medidas & Bíotipo", "Resultado", "Sobre"]
 with st.sidebar:
     st.header("Navegação")
-    choice = st.radio("", pages, index=pages.index(st.session_state["page"]))
-    if choice != st.session_state["page"]:
-        # Reset result if navigating away from results
-        if choice != "Resultado":
-            st.session_state["result_data"] = None
-        st.session_state["page"] = choice
-        st.experimental_rerun()
+    st.radio("", pages, key="page", on_change=_on_nav)
 
 def show_inicio():
     st.title("📏 Guia de Tabela de Medidas (ABNT)")
@@ -74,22 +85,65 @@ def show_inicio():
         confecção.  Suas informações não são armazenadas; use com bom senso.
         """
     )
-    if st.button("Começar", type="primary"):
-        st.session_state["page"] = "Medidas & Bíotipo"
-        st.experimental_rerun()
+    st.button("Começar", type="primary", on_click=_goto, args=("Medidas & Bíotipo",))
+
+def _calculate() -> None:
+    """Callback for the "Calcular" button: run the sizing algorithm.
+
+    Runs before the rerun triggered by the click, reading the measurement
+    widgets through their session state keys, so the results page renders
+    on that same rerun.
+    """
+    busto = st.session_state["busto"]
+    cintura = st.session_state["cintura"]
+    quadril = st.session_state["quadril"]
+    biotipo = st.session_state["biotipo"]
+    best, top3 = suggest_size_and_top(busto, cintura, quadril, biotipo)
+    estatura = classify_estatura(st.session_state["altura"])
+    # Prepare result data
+    result = {
+        "date_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "biotipo": biotipo,
+        "estatura": estatura,
+        "suggested_size": best["size"],
+        "top3": top3,
+        "tip": BIOTIPO_TIPS.get(biotipo),
+    }
+    # Render the display strings once here: the result is immutable until
+    # the next calculation, so the results page can re-emit them on every
+    # rerun without re-running the f-string formatting.
+    result["_rendered_header"] = (
+        f"Medidas informadas – Altura: **{st.session_state['altura']:.1f} cm** | "
+        f"Busto: **{busto:.1f} cm** | "
+        f"Cintura: **{cintura:.1f} cm** | "
+        f"Quadril: **{quadril:.1f} cm**"
+    )
+    result["_rendered_top3"] = [
+        f"{idx}. Tamanho {item['size']} – Distância: {item['dist']:.2f} | "
+        f"Ref. busto: {item['bust']} cm, cintura: {item['waist']} cm, quadril: {item['hip']} cm"
+        for idx, item in enumerate(top3, 1)
+    ]
+    st.session_state["result_data"] = result
+    st.session_state["inputs"] = {
+        "altura": st.session_state["altura"],
+        "busto": busto,
+        "cintura": cintura,
+        "quadril": quadril,
+    }
+    st.session_state["page"] = "Resultado"
 
 def show_inputs_page():
     st.header("Medidas & Bíotipo")
     st.markdown("Preencha suas medidas em centímetros. Valores decimais são aceitos (use ponto ou vírgula).")
     col1, col2 = st.columns(2)
     with col1:
-        altura = st.number_input("Altura (cm)", min_value=120.0, max_value=200.0, value=160.0, step=0.5)
-        busto  = st.number_input("Busto (cm)",  min_value=70.0,  max_value=160.0, value=90.0,  step=0.5)
+        st.number_input("Altura (cm)", min_value=120.0, max_value=200.0, value=160.0, step=0.5, key="altura")
+        st.number_input("Busto (cm)",  min_value=70.0,  max_value=160.0, value=90.0,  step=0.5, key="busto")
     with col2:
-        cintura= st.number_input("Cintura (cm)",min_value=50.0,  max_value=140.0, value=74.0,  step=0.5)
-        quadril= st.number_input("Quadril (cm)",min_value=80.0,  max_value=170.0, value=100.0, step=0.5)
+        st.number_input("Cintura (cm)",min_value=50.0,  max_value=140.0, value=74.0,  step=0.5, key="cintura")
+        st.number_input("Quadril (cm)",min_value=80.0,  max_value=170.0, value=100.0, step=0.5, key="quadril")
     # Body type selection
-    biotipo = st.selectbox("Bíotipo", list(BIOTIPO_WEIGHTS.keys()), index=0)
+    st.selectbox("Bíotipo", list(BIOTIPO_WEIGHTS.keys()), index=0, key="biotipo")
     # Optional display of figures
     if st.checkbox("Mostrar figuras dos bíotipos"):
         fig = create_biotipos_figure()
@@ -99,28 +153,7 @@ def show_inputs_page():
     if foto is not None:
         st.image(foto, caption="Pré‑visualização da foto", use_column_width=True)
     # Compute button
-    if st.button("Calcular tamanho sugerido", type="primary"):
-        # Run the sizing algorithm
-        best, top3 = suggest_size_and_top(busto, cintura, quadril, biotipo)
-        estatura = classify_estatura(altura)
-        # Prepare result data
-        result = {
-            "date_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "biotipo": biotipo,
-            "estatura": estatura,
-            "suggested_size": best["size"],
-            "top3": top3,
-            "tip": BIOTIPO_TIPS.get(biotipo),
-        }
-        st.session_state["result_data"] = result
-        st.session_state["inputs"] = {
-            "altura": altura,
-            "busto": busto,
-            "cintura": cintura,
-            "quadril": quadril,
-        }
-        st.session_state["page"] = "Resultado"
-        st.experimental_rerun()
+    st.button("Calcular tamanho sugerido", type="primary", on_click=_calculate)
 
 def show_results_page():
     st.header("Resultado")
@@ -129,15 +162,11 @@ def show_results_page():
         st.info("Nenhum resultado ainda. Por favor, preencha suas medidas na aba anterior.")
         return
     inputs = st.session_state.get("inputs", {})
-    # Display suggested size and details
+    # Display suggested size and details.  The measurement header and the
+    # top-3 lines were rendered once in _calculate; reruns just re-emit them.
     st.subheader(f"Tamanho sugerido: {result['suggested_size']}")
     st.write(f"Estatura de referência: **{result['estatura'].upper()}**")
-    st.write(
-        f"Medidas informadas – Altura: **{inputs.get('altura'):.1f} cm** | "
-        f"Busto: **{inputs.get('busto'):.1f} cm** | "
-        f"Cintura: **{inputs.get('cintura'):.1f} cm** | "
-        f"Quadril: **{inputs.get('quadril'):.1f} cm**"
-    )
+    st.write(result["_rendered_header"])
     st.write(f"Bíotipo: **{result['biotipo']}**")
     # Tip
     tip = result.get("tip")
@@ -145,33 +174,39 @@ def show_results_page():
         st.markdown(f"**Dica para o seu bíotipo:** {tip}")
     # Show top 3
     st.markdown("### Top 3 tamanhos mais próximos")
-    for idx, item in enumerate(result["top3"], 1):
-        st.write(
-            f"{idx}. Tamanho {item['size']} – Distância: {item['dist']:.2f} | "
-            f"Ref. busto: {item['bust']} cm, cintura: {item['waist']} cm, quadril: {item['hip']} cm"
-        )
+    for line in result["_rendered_top3"]:
+        st.write(line)
     # Download exports
     st.markdown("### Exportar resultados")
-    # Generate current figure for export
-    fig = create_biotipos_figure()
-    csv_bytes = generate_csv(result, inputs)
-    pdf_bytes = generate_pdf(result, inputs, fig)
     st.download_button(
         label="Baixar CSV",
-        data=csv_bytes,
+        data=csv_stream(result, inputs),
         file_name="resultado_medidas.csv",
         mime="text/csv",
     )
+    # The PDF build is kicked off on a background thread the first time
+    # this result is shown; the future doubles as the per-result memo, so
+    # reruns reuse it and it is replaced when a new calculation arrives.
+    # The download callable just collects the (usually already finished)
+    # future when the user clicks.
+    # The key must cover everything the report depends on: the measurements
+    # alone are not enough, since recalculating with the same numbers but a
+    # different biótipo (within the same minute) produces a different result.
+    pdf_key = (result["date_time"], result["biotipo"], tuple(sorted(inputs.items())))
+    if st.session_state.get("pdf_key") != pdf_key:
+        st.session_state["pdf_key"] = pdf_key
+        st.session_state["pdf_future"] = submit_pdf(result, inputs, biotipos_png_bytes())
+    pdf_future = st.session_state["pdf_future"]
+    if not pdf_future.done():
+        st.caption("Gerando PDF em segundo plano…")
     st.download_button(
         label="Baixar PDF",
-        data=pdf_bytes,
+        data=pdf_future.result,
         file_name="relatorio_medidas.pdf",
         mime="application/pdf",
     )
     # Allow recalculation
-    if st.button("Nova consulta", type="secondary"):
-        st.session_state["page"] = "Medidas & Bíotipo"
-        st.experimental_rerun()
+    st.button("Nova consulta", type="secondary", on_click=_goto, args=("Medidas & Bíotipo",))
 
 def show_about_page():
     st.header("Sobre o aplicativo")
@@ -13,31 +13,80 @@ including the user's measurements, the suggested size, the top three
 candidates and a small illustration of the body types.
 """
 
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from datetime import datetime
-from typing import Dict, List
-
-import pandas as pd
-try:
-    # Attempt to import reportlab for PDF generation.  Reportlab provides
-    # precise control over typography and layout and is preferred when
-    # available.  If reportlab is not installed, we will fall back to
-    # matplotlib's PDF backend.
-    from reportlab.platypus import (
-        SimpleDocTemplate,
-        Paragraph,
-        Spacer,
-        Image,
-        Table,
-        TableStyle,
-    )
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.lib.styles import getSampleStyleSheet
-    _REPORTLAB_AVAILABLE = True
-except ImportError:
-    _REPORTLAB_AVAILABLE = False
+from typing import Callable, Dict, Iterator, List
 
+import matplotlib
+matplotlib.use("Agg")
+
+# Availability of reportlab is resolved lazily on the first PDF export so
+# that the app's cold start does not pay for the import when the user never
+# requests a PDF.  ``None`` means the import has not been attempted yet.
+_REPORTLAB_AVAILABLE = None
+
+def _ensure_reportlab() -> bool:
+    """Import reportlab on first use and memoise the outcome.
+
+    Reportlab provides precise control over typography and layout and is
+    preferred when available.  If reportlab is not installed, callers fall
+    back to matplotlib's PDF backend.  The imported names are published as
+    module globals so subsequent calls skip the import machinery entirely.
+    """
+    global _REPORTLAB_AVAILABLE
+    global SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+    global letter, colors, getSampleStyleSheet
+    if _REPORTLAB_AVAILABLE is None:
+        try:
+            from reportlab.platypus import (
+                SimpleDocTemplate,
+                Paragraph,
+                Spacer,
+                Image,
+                Table,
+                TableStyle,
+            )
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib import colors
+            from reportlab.lib.styles import getSampleStyleSheet
+            _REPORTLAB_AVAILABLE = True
+        except ImportError:
+            _REPORTLAB_AVAILABLE = False
+    return _REPORTLAB_AVAILABLE
+
+# Helpers for the matplotlib PDF fallback, also resolved lazily: after the
+# first fallback export the names are module globals and later calls
+# reduce to a single sentinel check instead of repeated import-machinery
+# lookups inside the function body.
+_MPL_PDF_LOADED = False
+
+def _ensure_mpl_pdf() -> None:
+    """Load the matplotlib fallback's imports once, on first use."""
+    global _MPL_PDF_LOADED, PdfPages, Figure, mpimg, textwrap
+    if not _MPL_PDF_LOADED:
+        from matplotlib.backends.backend_pdf import PdfPages
+        from matplotlib.figure import Figure
+        import matplotlib.image as mpimg
+        import textwrap
+        _MPL_PDF_LOADED = True
+
+
+# Reusable per-thread scratch buffer for assembling PDF documents.
+# Repeated exports reset and refill the same BytesIO instead of allocating
+# a fresh one per download, easing allocator and GC pressure.
+_bufpool = threading.local()
+
+def _get_buf() -> BytesIO:
+    """Return this thread's scratch ``BytesIO``, reset to empty."""
+    buf = getattr(_bufpool, "buf", None)
+    if buf is None:
+        buf = _bufpool.buf = BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
 
 def generate_csv(result_data: Dict[str, any], inputs: Dict[str, float]) -> bytes:
     """Create a CSV representation of the result and user inputs.
@@ -57,22 +106,92 @@ def generate_csv(result_data: Dict[str, any], inputs: Dict[str, float]) -> bytes
     bytes
         UTF‑8 encoded CSV data ready for download.
     """
+    return _CSV_HEADER + _csv_row(result_data, inputs)
+
+# Fixed nine-column header of the CSV export, kept as an encoded constant.
+_CSV_HEADER = (
+    b"data_hora,altura_cm,busto_cm,cintura_cm,quadril_cm,"
+    b"biotipo,estatura,tamanho_sugerido,top3\r\n"
+)
+
+def _csv_row(result_data: Dict[str, any], inputs: Dict[str, float]) -> bytes:
+    """Format one result as a CSV data line, UTF‑8 encoded.
+
+    All fields are numeric or come from fixed-key dictionaries (biótipo,
+    estatura), so the line can be assembled with a single f-string instead
+    of the csv module's dialect state machine; only the top3 column, which
+    legitimately contains commas, is quoted.
+    """
     # Flatten the top3 list into a comma‑separated string of sizes
     top3_sizes = ", ".join(str(item["size"]) for item in result_data.get("top3", []))
-    df = pd.DataFrame({
-        "data_hora": [result_data.get("date_time")],
-        "altura_cm": [inputs.get("altura")],
-        "busto_cm": [inputs.get("busto")],
-        "cintura_cm": [inputs.get("cintura")],
-        "quadril_cm": [inputs.get("quadril")],
-        "biotipo": [result_data.get("biotipo")],
-        "estatura": [result_data.get("estatura")],
-        "tamanho_sugerido": [result_data.get("suggested_size")],
-        "top3": [top3_sizes],
-    })
-    return df.to_csv(index=False).encode("utf-8")
-
-def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig) -> bytes:
+    biotipo = result_data.get("biotipo")
+    # Safety net for the no-quoting assumption above: biótipo is the only
+    # vocabulary field a new entry could plausibly break.
+    assert "," not in str(biotipo), f"biótipo inesperado com vírgula: {biotipo!r}"
+    return (
+        f"{result_data.get('date_time')},{inputs.get('altura')},"
+        f"{inputs.get('busto')},{inputs.get('cintura')},{inputs.get('quadril')},"
+        f"{biotipo},{result_data.get('estatura')},"
+        f"{result_data.get('suggested_size')},\"{top3_sizes}\"\r\n"
+    ).encode("utf-8")
+
+def generate_csv_iter(result_data: Dict[str, any], inputs: Dict[str, float]) -> Iterator[bytes]:
+    """Yield the CSV export line by line as UTF‑8 encoded bytes.
+
+    The header row is produced first, followed by one line per result row
+    (currently a single row).  Producing the file lazily keeps memory
+    proportional to one row rather than the whole export, which matters if
+    the export ever grows beyond a single result.
+
+    Parameters are the same as for ``generate_csv``.
+    """
+    yield _CSV_HEADER
+    yield _csv_row(result_data, inputs)
+
+class _IterStream(io.RawIOBase):
+    """Read‑only file‑like adapter over an iterator of byte chunks.
+
+    ``st.download_button`` accepts file‑like objects, so wrapping the CSV
+    generator in this adapter lets Streamlit pull the bytes lazily instead
+    of requiring the whole export to be materialised first.  ``seek(0)``
+    (which Streamlit issues before reading) restarts the underlying
+    iterator so the stream can be consumed again on a later rerun.
+    """
+
+    def __init__(self, chunk_factory: Callable[[], Iterator[bytes]]) -> None:
+        self._chunk_factory = chunk_factory
+        self._chunks = chunk_factory()
+        self._leftover = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        if pos != 0 or whence != 0:
+            raise io.UnsupportedOperation("only seek(0) is supported")
+        self._chunks = self._chunk_factory()
+        self._leftover = b""
+        return 0
+
+    def readinto(self, b) -> int:
+        if not self._leftover:
+            try:
+                self._leftover = next(self._chunks)
+            except StopIteration:
+                return 0
+        out = self._leftover[:len(b)]
+        b[:len(out)] = out
+        self._leftover = self._leftover[len(out):]
+        return len(out)
+
+def csv_stream(result_data: Dict[str, any], inputs: Dict[str, float]) -> _IterStream:
+    """Return a lazily evaluated file‑like CSV export for ``st.download_button``."""
+    return _IterStream(lambda: generate_csv_iter(result_data, inputs))
+
+def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig_png: bytes) -> bytes:
     """Generate a PDF report from the result data and user inputs.
 
     This function attempts to use reportlab for high‑quality PDF output.  If
@@ -85,17 +204,18 @@ def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig) ->
         Dictionary containing the sizing result (see ``generate_csv``).
     inputs : dict
         Dictionary of user measurements.
-    fig : matplotlib.figure.Figure
-        Figure illustrating the body types; may be None.
+    fig_png : bytes
+        PNG-encoded illustration of the body types (see
+        ``figures.biotipos_png_bytes``); may be None.
 
     Returns
     -------
     bytes
         The binary content of the generated PDF.
     """
-    if _REPORTLAB_AVAILABLE:
+    if _ensure_reportlab():
         # High‑fidelity report using reportlab
-        buffer = BytesIO()
+        buffer = _get_buf()
         doc = SimpleDocTemplate(
             buffer,
             pagesize=letter,
@@ -162,13 +282,12 @@ def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig) ->
             elements.append(Paragraph(tip, styles["Normal"]))
             elements.append(Spacer(1, 12))
         # Insert figure
-        if fig is not None:
+        if fig_png is not None:
             try:
-                img_buffer = BytesIO()
-                fig.savefig(img_buffer, format="png", bbox_inches='tight')
-                img_buffer.seek(0)
-                max_width = 500
-                img = Image(img_buffer, width=max_width, height=max_width * 0.6)
+                # The PNG is pre-rendered at the embed size (see
+                # figures.biotipos_png_bytes), so no width/height is passed
+                # and reportlab skips its draw-time resampling.
+                img = Image(BytesIO(fig_png))
                 elements.append(img)
                 elements.append(Spacer(1, 12))
             except Exception:
@@ -178,79 +297,78 @@ def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig) ->
         buffer.seek(0)
         return buffer.read()
     else:
-        # Fallback PDF generation using matplotlib
-        from matplotlib.backends.backend_pdf import PdfPages
-        import matplotlib.pyplot as plt
-        # Create a BytesIO to capture the PDF
-        buf = BytesIO()
+        # Fallback PDF generation using matplotlib.  Figures are created
+        # directly (no pyplot) so no interactive figure-manager state is
+        # touched and nothing needs to be closed afterwards.
+        _ensure_mpl_pdf()
+        # Reuse the per-thread scratch buffer to capture the PDF
+        buf = _get_buf()
         # Use a PdfPages context to add pages
         with PdfPages(buf) as pdf:
             # First page with text
-            fig_page = plt.figure(figsize=(8.5, 11))
+            fig_page = Figure(figsize=(8.5, 11))
             fig_page.patch.set_facecolor('white')
+
+            def text_block(y, lines, fontsize=10, **kwargs):
+                """Emit ``lines`` as one multiline Text artist, return new y.
+
+                Batching each section into a single artist keeps the number
+                of Text objects (and font shaping passes) small compared to
+                one artist per row.
+                """
+                fig_page.text(0.1, y, "\n".join(lines), fontsize=fontsize,
+                              va='top', **kwargs)
+                return y - 0.03 * len(lines)
+
             y = 0.95
             # Title
             fig_page.text(0.5, y, 'Guia de Tabela de Medidas', ha='center', fontsize=16, weight='bold')
             y -= 0.05
             # Timestamp
             now_str = result_data.get('date_time', datetime.now().strftime('%Y-%m-%d %H:%M'))
-            fig_page.text(0.1, y, f'Data/hora: {now_str}', fontsize=10)
-            y -= 0.05
+            y = text_block(y, [f'Data/hora: {now_str}']) - 0.02
             # Measurements
-            fig_page.text(0.1, y, 'Medidas informadas:', fontsize=12, weight='bold')
-            y -= 0.03
-            fig_page.text(0.1, y, f"Altura: {inputs.get('altura')} cm", fontsize=10)
-            y -= 0.03
-            fig_page.text(0.1, y, f"Busto: {inputs.get('busto')} cm", fontsize=10)
-            y -= 0.03
-            fig_page.text(0.1, y, f"Cintura: {inputs.get('cintura')} cm", fontsize=10)
-            y -= 0.03
-            fig_page.text(0.1, y, f"Quadril: {inputs.get('quadril')} cm", fontsize=10)
-            y -= 0.05
+            y = text_block(y, ['Medidas informadas:'], fontsize=12, weight='bold')
+            y = text_block(y, [
+                f"Altura: {inputs.get('altura')} cm",
+                f"Busto: {inputs.get('busto')} cm",
+                f"Cintura: {inputs.get('cintura')} cm",
+                f"Quadril: {inputs.get('quadril')} cm",
+            ]) - 0.02
             # Body type and estatura
-            fig_page.text(0.1, y, f"Bíotipo: {result_data.get('biotipo')}", fontsize=10)
-            y -= 0.03
-            fig_page.text(0.1, y, f"Estatura: {result_data.get('estatura').upper()}", fontsize=10)
-            y -= 0.05
+            y = text_block(y, [
+                f"Bíotipo: {result_data.get('biotipo')}",
+                f"Estatura: {result_data.get('estatura').upper()}",
+            ]) - 0.02
             # Suggested size
-            fig_page.text(0.1, y, f"Tamanho sugerido: {result_data.get('suggested_size')}", fontsize=12, weight='bold')
-            y -= 0.05
+            y = text_block(y, [f"Tamanho sugerido: {result_data.get('suggested_size')}"],
+                           fontsize=12, weight='bold') - 0.02
             # Top 3
-            fig_page.text(0.1, y, 'Top 3 tamanhos mais próximos:', fontsize=12, weight='bold')
-            y -= 0.04
+            y = text_block(y, ['Top 3 tamanhos mais próximos:'], fontsize=12, weight='bold') - 0.01
             top3 = result_data.get('top3', [])
-            for idx, item in enumerate(top3, 1):
-                fig_page.text(0.1, y, f"{idx}. Tamanho {item['size']} – Distância {item['dist']:.2f} | "
-                                f"Ref.: {item['bust']} / {item['waist']} / {item['hip']} cm", fontsize=9)
-                y -= 0.03
+            y = text_block(y, [
+                f"{idx}. Tamanho {item['size']} – Distância {item['dist']:.2f} | "
+                f"Ref.: {item['bust']} / {item['waist']} / {item['hip']} cm"
+                for idx, item in enumerate(top3, 1)
+            ], fontsize=9)
             # Tip
             tip = result_data.get('tip')
             if tip:
                 y -= 0.02
-                fig_page.text(0.1, y, 'Dica para o seu bíotipo:', fontsize=12, weight='bold')
-                y -= 0.03
+                y = text_block(y, ['Dica para o seu bíotipo:'], fontsize=12, weight='bold')
                 # Wrap tip text across lines if necessary
-                import textwrap
-                for line in textwrap.wrap(tip, width=70):
-                    fig_page.text(0.1, y, line, fontsize=9)
-                    y -= 0.03
+                text_block(y, textwrap.wrap(tip, width=70), fontsize=9)
             # Add page
             pdf.savefig(fig_page)
-            plt.close(fig_page)
             # Second page with the illustration, if provided
-            if fig is not None:
-                fig2 = plt.figure(figsize=(8.5, 11))
+            if fig_png is not None:
+                fig2 = Figure(figsize=(8.5, 11))
                 fig2.patch.set_facecolor('white')
                 # Title for the figures page
                 fig2.text(0.5, 0.95, 'Biótipos (figuras esquemáticas)', ha='center', fontsize=14, weight='bold')
-                # Convert the passed figure into an array and embed it
-                from io import BytesIO as _BytesIO
-                import matplotlib.image as mpimg
-                tmp = _BytesIO()
+                # Decode the pre-rendered PNG into an array and embed it
                 try:
-                    fig.savefig(tmp, format='png', bbox_inches='tight')
-                    tmp.seek(0)
-                    img_arr = mpimg.imread(tmp)
+                    img_arr = mpimg.imread(BytesIO(fig_png))
                     # Create an axes that covers most of the page and display the image
                     ax_img = fig2.add_axes([0.05, 0.1, 0.9, 0.8])
                     ax_img.imshow(img_arr)
@@ -259,6 +377,21 @@ def generate_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig) ->
                     # If embedding fails, just leave the page blank beneath the title
                     pass
                 pdf.savefig(fig2)
-                plt.close(fig2)
         buf.seek(0)
         return buf.read()
+
+# Background executor for PDF generation.  Building a report blocks for a
+# noticeable moment on small instances; running it off the script thread
+# lets the user keep interacting while the document is assembled.  Two
+# workers are plenty for a per-session export, and the per-thread scratch
+# buffer above keeps the workers from sharing state.
+_EXEC = ThreadPoolExecutor(max_workers=2)
+
+def submit_pdf(result_data: Dict[str, any], inputs: Dict[str, float], fig_png: bytes) -> Future:
+    """Schedule ``generate_pdf`` on the background executor.
+
+    Returns the ``Future`` so the caller can stash it (e.g. in Streamlit
+    session state) and collect the bytes with ``result()`` when the user
+    actually asks for the download.
+    """
+    return _EXEC.submit(generate_pdf, result_data, inputs, fig_png)
@@ -16,10 +16,89 @@ displayed in a Streamlit interface via ``st.pyplot`` or saved to an image
 buffer when generating a PDF report.
 """
 
-import matplotlib.pyplot as plt
+from io import BytesIO
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
 import numpy as np
+import streamlit as st
+
+# Closed polygon coordinates (first vertex repeated) for each body shape.
+# They are built once at import as NumPy arrays, so figure construction
+# hands matplotlib contiguous data instead of rebuilding per-shape Python
+# lists; matplotlib would convert those lists to arrays anyway.
+RETANGULAR = np.array([
+    (0.4, 0.1), (0.6, 0.1), (0.65, 0.55), (0.35, 0.55), (0.4, 0.1),
+])
+VIOLAO = np.array([
+    (0.45, 0.1), (0.55, 0.1), (0.62, 0.40), (0.50, 0.55), (0.38, 0.40), (0.45, 0.1),
+])
+AMPULHETA = np.array([
+    (0.42, 0.1), (0.58, 0.1), (0.66, 0.38), (0.50, 0.55), (0.34, 0.38), (0.42, 0.1),
+])
+TRIANGULO = np.array([
+    (0.46, 0.1), (0.54, 0.1), (0.57, 0.35), (0.70, 0.55), (0.30, 0.55), (0.43, 0.35), (0.46, 0.1),
+])
+TRIANGULO_INVERTIDO = np.array([
+    (0.30, 0.1), (0.70, 0.1), (0.57, 0.35), (0.43, 0.35), (0.30, 0.1),
+])
+
+def _oval_points(n: int = 64) -> np.ndarray:
+    """Sample the oval silhouette as a closed polyline.
+
+    At the size the figure is displayed, 64 vertices are perceptually
+    indistinguishable from a denser sampling, and fewer vertices mean
+    proportionally less path-rendering work in Agg.  float32 suffices
+    since the renderer downcasts anyway.
+    """
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False, dtype=np.float32)
+    t = np.append(t, t[0])
+    return np.column_stack((0.5 + 0.12 * np.cos(t), 0.33 + 0.22 * np.sin(t)))
+
+OVAL = _oval_points()
+
+def _build_biotipos_figure() -> Figure:
+    """Construct a fresh figure with the six body type silhouettes.
+
+    This is the uncached builder: use :func:`create_biotipos_figure` for
+    display, which returns a shared read‑only instance, or call this
+    directly when a private figure is needed (e.g. to resize it for the
+    PDF export).
+    """
+    # Instantiate the Figure directly rather than via pyplot so no global
+    # figure-manager state is created; only the Agg renderer is needed on
+    # a headless Streamlit server.
+    fig = Figure(figsize=(10, 6))
+    axes = fig.subplots(2, 3).ravel()
+
+    def draw_shape(ax, pts_closed, title: str):
+        """Helper to draw a closed polygon shape and its border on an axis."""
+        ax.fill(pts_closed[:, 0], pts_closed[:, 1], alpha=0.35, color="#cccccc")
+        ax.plot(pts_closed[:, 0], pts_closed[:, 1], linewidth=2, color="#555555")
+        ax.set_title(title, fontsize=10, pad=6)
+        ax.set_aspect('equal')
+        ax.axis('off')
+
+    # Draw the shapes; the oval is just another precomputed closed polyline
+    draw_shape(axes[0], RETANGULAR, "Retangular")
+    draw_shape(axes[1], VIOLAO,     "Violão")
+    draw_shape(axes[2], AMPULHETA,  "Ampulheta")
+    draw_shape(axes[3], TRIANGULO,  "Triângulo")
+    draw_shape(axes[4], TRIANGULO_INVERTIDO, "Triângulo invertido")
+    draw_shape(axes[5], OVAL,       "Oval")
+
+    # Overall title
+    fig.suptitle("Biótipos (figuras esquemáticas didáticas)", fontsize=12, y=0.98)
+    # The geometry is deterministic, so fixed margins replace tight_layout
+    # and its iterative, text-measuring layout solver.  These values were
+    # tuned once against the 2x3 grid.
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.88, bottom=0.03,
+                        wspace=0.08, hspace=0.18)
+    return fig
 
-def create_biotipos_figure() -> plt.Figure:
+@st.cache_resource(show_spinner=False)
+def create_biotipos_figure() -> Figure:
     """Create a matplotlib figure containing stylised body type silhouettes.
 
     The figure contains six subplots arranged in a 2×3 grid.  Each subplot
@@ -28,53 +107,41 @@ def create_biotipos_figure() -> plt.Figure:
     invertido and Oval).  Colours are kept neutral to ensure the drawings
     integrate well with a light‑themed Streamlit app.
 
+    The figure is static, so it is built once per process and cached with
+    ``st.cache_resource``; subsequent reruns (and sessions) reuse the same
+    object.  Callers must therefore treat the returned figure as read‑only
+    and must not close or mutate it.
+
     Returns
     -------
-    plt.Figure
-        The created matplotlib figure.  The caller is responsible for
-        disposing of the figure if re‑creating multiple times to avoid
-        memory leaks.
+    Figure
+        The cached matplotlib figure.
     """
-    # Create the figure and axes
-    fig, axes = plt.subplots(2, 3, figsize=(10, 6))
-    axes = axes.ravel()
-
-    def draw_shape(ax, pts, title: str):
-        """Helper to draw a polygon shape and its border on a given axis."""
-        # Separate the x and y coordinates
-        xs = [p[0] for p in pts] + [pts[0][0]]
-        ys = [p[1] for p in pts] + [pts[0][1]]
-        ax.fill(xs, ys, alpha=0.35, color="#cccccc")
-        ax.plot(xs, ys, linewidth=2, color="#555555")
-        ax.set_title(title, fontsize=10, pad=6)
-        ax.set_aspect('equal')
-        ax.axis('off')
+    return _build_biotipos_figure()
 
-    # Define the coordinates for each body shape
-    retangular = [(0.4, 0.1), (0.6, 0.1), (0.65, 0.55), (0.35, 0.55)]
-    violao     = [(0.45, 0.1), (0.55, 0.1), (0.62, 0.40), (0.50, 0.55), (0.38, 0.40)]
-    ampulheta  = [(0.42, 0.1), (0.58, 0.1), (0.66, 0.38), (0.50, 0.55), (0.34, 0.38)]
-    triangulo  = [(0.46, 0.1), (0.54, 0.1), (0.57, 0.35), (0.70, 0.55), (0.30, 0.55), (0.43, 0.35)]
-    tri_inv    = [(0.30, 0.1), (0.70, 0.1), (0.57, 0.35), (0.43, 0.35)]
-    # For the oval, generate points along an ellipse
-    t = np.linspace(0, 2 * np.pi, 200)
-    oval_x = 0.5 + 0.12 * np.cos(t)
-    oval_y = 0.33 + 0.22 * np.sin(t)
-
-    # Draw the polygonal shapes
-    draw_shape(axes[0], retangular, "Retangular")
-    draw_shape(axes[1], violao,     "Violão")
-    draw_shape(axes[2], ampulheta,  "Ampulheta")
-    draw_shape(axes[3], triangulo,  "Triângulo")
-    draw_shape(axes[4], tri_inv,    "Triângulo invertido")
-    # Draw the oval separately
-    axes[5].fill(oval_x, oval_y, alpha=0.35, color="#cccccc")
-    axes[5].plot(oval_x, oval_y, linewidth=2, color="#555555")
-    axes[5].set_title("Oval", fontsize=10, pad=6)
-    axes[5].set_aspect('equal')
-    axes[5].axis('off')
+# Pixel dimensions at which the PDF report embeds the illustration.  The
+# PNG is rendered at exactly this size (at 72 dpi, reportlab's native
+# resolution) so the Image flowable uses it as-is without resampling.
+_PDF_IMG_WIDTH_PX = 500
+_PDF_IMG_HEIGHT_PX = 300
 
-    # Overall title
-    fig.suptitle("Biótipos (figuras esquemáticas didáticas)", fontsize=12, y=0.98)
-    fig.tight_layout()
-    return fig
+@st.cache_data(show_spinner=False)
+def biotipos_png_bytes() -> bytes:
+    """Return the biotipos figure rendered as PNG bytes, cached per process.
+
+    PNG encoding dominates the cost of the PDF export, so the figure is
+    serialised once and the raw bytes are reused for every subsequent
+    report.  A private figure is built and sized to the exact pixel
+    dimensions the report embeds, which lets reportlab draw the image at
+    its native size instead of resampling it on every export.
+
+    Returns
+    -------
+    bytes
+        The PNG-encoded illustration of the six body types.
+    """
+    fig = _build_biotipos_figure()
+    fig.set_size_inches(_PDF_IMG_WIDTH_PX / 72, _PDF_IMG_HEIGHT_PX / 72)
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=72)
+    return buf.getvalue()
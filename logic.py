@@ -23,8 +23,41 @@ square root. A smaller distance indicates a better fit. See
 """
 
 import math
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+import numpy as np
+
+try:
+    # Numba is an optional accelerator: when present, the distance kernel
+    # below is JIT-compiled (and cached on disk across restarts); when
+    # absent, a NumPy fallback with identical semantics is used.
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+try:
+    # simsimd is likewise optional: its cdist kernel serves the batch path
+    # with hand-written SIMD when the reference table is large enough to
+    # amortize the call (see _l2sq).
+    import simsimd
+    _HAS_SIMSIMD = True
+except ImportError:
+    _HAS_SIMSIMD = False
+
+try:
+    # Compiled scoring kernel (see logic_kernel.pyx and setup.py).  When
+    # built, suggest_size_and_top runs distance computation and top-N
+    # selection in one C call; otherwise the NumPy path below is used.
+    from logic_kernel import score_and_topn as _c_score_and_topn
+    _HAS_C_KERNEL = True
+except ImportError:
+    _HAS_C_KERNEL = False
+
 # ---------------------------------------------------------------------------
 # Size chart definition
 # ---------------------------------------------------------------------------
@@ -39,25 +72,45 @@ BUST_SEQ: List[int] = [80 + 4 * i for i in range(len(SIZES))]
 WAIST_SEQ: List[int] = [68 + 4 * i for i in range(len(SIZES))]
 HIP_SEQ: List[int] = [86 + 4 * i for i in range(len(SIZES))]
 
-# Combine the numeric size and reference measurements into a single list of
-# dictionaries.  Each entry holds the numeric size along with the bust,
-# waist and hip circumferences for that size.
-SIZE_CHART: List[Dict[str, float]] = [
-    {"size": s, "bust": b, "waist": w, "hip": h}
-    for s, b, w, h in zip(SIZES, BUST_SEQ, WAIST_SEQ, HIP_SEQ)
+# Combine the numeric size and reference measurements into a single frozen
+# table.  Each row is a (size, bust, waist, hip) tuple; the table is
+# constant and accessed by position, so immutable tuples beat a list of
+# per-row dicts (no hash lookups, nothing for a caller to mutate).
+SIZE_CHART: Tuple[Tuple[int, int, int, int], ...] = tuple(
+    zip(SIZES, BUST_SEQ, WAIST_SEQ, HIP_SEQ)
+)
+
+# Dict-per-row view of the chart for consumers that want named fields
+# rather than positions (mirrors the entries score_sizes returns, minus
+# the distance).
+SIZE_CHART_DICTS: List[Dict[str, float]] = [
+    {"size": s, "bust": b, "waist": w, "hip": h} for s, b, w, h in SIZE_CHART
 ]
 
+
 # ---------------------------------------------------------------------------
 # Estatura (height) classification
 # ---------------------------------------------------------------------------
 
 # Height bins for classifying the user's estatura into baixa, média or alta.
+# Kept as the display constant for the UI layer; classification itself uses
+# the flattened edges below.
 STATURE_BINS: Dict[str, Tuple[int, int]] = {
     "baixa": (150, 157),
     "média": (158, 165),
     "alta":  (166, 181),
 }
 
+# Flattened classification edges, paired with the labels.  A single bisect
+# over these reproduces the bin walk plus all of its approximations exactly:
+# 'baixa' up to and including 157 (also anything below the chart), 'média'
+# strictly above 157 and strictly below 166 (covering both inter-bin gaps),
+# and 'alta' from 166 up.  Because 'média' starts *exclusively* at 157, its
+# edge is nudged to the next representable float so bisect_right (which
+# treats edges inclusively) draws the boundary on the correct side.
+_STAT_EDGES: Tuple[float, ...] = (math.nextafter(157.0, math.inf), 166.0)
+_STAT_LABELS: Tuple[str, ...] = tuple(STATURE_BINS)
+
 def classify_estatura(altura_cm: float) -> str:
     """Classify height into 'baixa', 'média' or 'alta'.
 
@@ -75,18 +128,7 @@ def classify_estatura(altura_cm: float) -> str:
     str
         One of 'baixa', 'média' or 'alta'.
     """
-    for nome, (lo, hi) in STATURE_BINS.items():
-        if lo <= altura_cm <= hi:
-            return nome
-    # If outside the bins, approximate to nearest category
-    min_bin_low = min(bin_range[0] for bin_range in STATURE_BINS.values())
-    max_bin_high = max(bin_range[1] for bin_range in STATURE_BINS.values())
-    if altura_cm < min_bin_low:
-        return "baixa"
-    if altura_cm > max_bin_high:
-        return "alta"
-    # In-between gaps: default to média
-    return "média"
+    return _STAT_LABELS[bisect_right(_STAT_EDGES, altura_cm)]
 
 # ---------------------------------------------------------------------------
 # Body type weighting
@@ -106,6 +148,85 @@ BIOTIPO_WEIGHTS: Dict[str, Dict[str, float]] = {
     "Oval":                {"bust": 1.0, "waist": 1.6, "hip": 1.0},
 }
 
+@lru_cache(maxsize=None)
+def _weights_tuple(biotipo: str) -> Tuple[float, float, float]:
+    """Resolve a biótipo name to its weight scalars in (bust, waist, hip) order.
+
+    Unknown names fall back to 'Retangular', matching the behaviour of the
+    scoring functions.  Cached so the nested dict lookups run once per name
+    ever seen (only six valid names exist); this is the single resolution
+    point for any caller that needs the raw scalars.
+    """
+    w = BIOTIPO_WEIGHTS.get(biotipo, BIOTIPO_WEIGHTS["Retangular"])
+    return (w["bust"], w["waist"], w["hip"])
+
+@dataclass(frozen=True)
+class _Tables:
+    """Derived scoring tables, built once on first use by :func:`_tables`.
+
+    ``bust``/``waist``/``hip``/``sizes`` are the chart columns in
+    structure-of-arrays layout (contiguous float32, int16 for sizes), so
+    scoring is a handful of vectorized C loops instead of a Python-level
+    walk over dicts.  ``precomp`` holds, per biótipo, the reference
+    columns pre-multiplied by the weights plus the weight scalars –
+    algebraically (user - ref) * w == user * w - ref * w, so the constant
+    side is scaled once here.  ``precomp_batch`` is the same data stacked
+    into one (15, 3) matrix per biótipo for the broadcast batch path, and
+    ``row_templates`` the static portion of each public result entry.
+    """
+    bust: np.ndarray
+    waist: np.ndarray
+    hip: np.ndarray
+    sizes: np.ndarray
+    precomp: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray,
+                             np.float32, np.float32, np.float32]]
+    precomp_batch: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    row_templates: Tuple[Dict[str, float], ...]
+
+@lru_cache(maxsize=None)
+def _tables() -> _Tables:
+    """Build (and memoize) the derived NumPy tables.
+
+    Deferred to first use rather than run at import so importing this
+    module – from the app, a test collection pass or a tool that only
+    needs the constants above – stays near-free; only the first scoring
+    call pays for table construction.
+    """
+    bust = np.array(BUST_SEQ, dtype=np.float32)
+    waist = np.array(WAIST_SEQ, dtype=np.float32)
+    hip = np.array(HIP_SEQ, dtype=np.float32)
+    precomp = {
+        nome: (
+            np.float32(wb) * bust,
+            np.float32(ww) * waist,
+            np.float32(wh) * hip,
+            np.float32(wb), np.float32(ww), np.float32(wh),
+        )
+        for nome, (wb, ww, wh) in (
+            (nome, _weights_tuple(nome)) for nome in BIOTIPO_WEIGHTS
+        )
+    }
+    precomp_batch = {
+        nome: (
+            np.stack((wB, wW, wH), axis=1),
+            np.array((wb, ww, wh), dtype=np.float32),
+        )
+        for nome, (wB, wW, wH, wb, ww, wh) in precomp.items()
+    }
+    row_templates = tuple(
+        {"size": s, "dist": 0.0, "bust": b, "waist": w, "hip": h}
+        for s, b, w, h in SIZE_CHART
+    )
+    return _Tables(
+        bust=bust,
+        waist=waist,
+        hip=hip,
+        sizes=np.array(SIZES, dtype=np.int16),
+        precomp=precomp,
+        precomp_batch=precomp_batch,
+        row_templates=row_templates,
+    )
+
 # Short advisory text per body type.  These are used in the app to offer
 # qualitative guidance alongside the numeric size suggestion.
 BIOTIPO_TIPS: Dict[str, str] = {
@@ -117,6 +238,75 @@ BIOTIPO_TIPS: Dict[str, str] = {
     "Oval":                "Conforto na região média; caimento reto com folga adequada.",
 }
 
+if _NUMBA_AVAILABLE:
+    # The explicit signature makes compilation eager at import (served from
+    # numba's disk cache after the first run), and fastmath lets LLVM fuse
+    # and vectorize the multiply/add chain without strict-IEEE ordering,
+    # which is safe here: the inputs are small positive centimetre values.
+    @njit(
+        "float32[:](float32, float32, float32, float32, float32, float32,"
+        " float32[:], float32[:], float32[:])",
+        cache=True,
+        fastmath=True,
+    )
+    def _weighted_dists_sq(ub, uw, uh, wb, ww, wh, wbust, wwaist, whip):
+        """Squared weighted distance from the user to every chart row.
+
+        The reference arrays arrive pre-multiplied by the weights (see
+        ``_tables``), so only the user side is scaled here.  sqrt is
+        monotonic, so ranking on the squared distance gives the same
+        ordering and the root is taken only for the entries returned to
+        callers.
+        """
+        n = wbust.shape[0]
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            db = ub * wb - wbust[i]
+            dw = uw * ww - wwaist[i]
+            dh = uh * wh - whip[i]
+            out[i] = db * db + dw * dw + dh * dh
+        return out
+else:
+    def _weighted_dists_sq(ub, uw, uh, wb, ww, wh, wbust, wwaist, whip):
+        """Squared weighted distance from the user to every chart row.
+
+        The reference arrays arrive pre-multiplied by the weights (see
+        ``_tables``), so only the user side is scaled here.  sqrt is
+        monotonic, so ranking on the squared distance gives the same
+        ordering and the root is taken only for the entries returned to
+        callers.
+        """
+        db = ub * wb - wbust
+        dw = uw * ww - wwaist
+        dh = uh * wh - whip
+        return db * db + dw * dw + dh * dh
+
+def _compute_dists_sq(user_bust: float, user_waist: float, user_hip: float, biotipo: str) -> np.ndarray:
+    """Return the squared weighted distance to every chart row, in chart order."""
+    precomp = _tables().precomp
+    wB, wW, wH, wb, ww, wh = precomp.get(biotipo, precomp["Retangular"])
+    return _weighted_dists_sq(
+        np.float32(user_bust), np.float32(user_waist), np.float32(user_hip),
+        wb, ww, wh, wB, wW, wH,
+    )
+
+def _materialize(order, dist_sq) -> List[Dict[str, float]]:
+    """Build the public dict entries for the chart rows in ``order``.
+
+    Copies a per-row template from the tables (rather than assembling
+    every entry from four parallel-sequence lookups) and fills in the
+    distance.  The public 'dist' key stays a true Euclidean distance, so
+    the square root deferred by the kernels is applied here – only for
+    the entries a caller actually receives.
+    """
+    templates = _tables().row_templates
+    out: List[Dict[str, float]] = []
+    for i in order:
+        entry = dict(templates[i])
+        entry["dist"] = math.sqrt(float(dist_sq[i]))
+        out.append(entry)
+    return out
+
 def score_sizes(user_bust: float, user_waist: float, user_hip: float, biotipo: str) -> List[Dict[str, float]]:
     """Compute a list of candidate sizes ordered by fit distance.
 
@@ -143,23 +333,215 @@ def score_sizes(user_bust: float, user_waist: float, user_hip: float, biotipo: s
         dictionary contains the keys 'size', 'dist', 'bust', 'waist' and
         'hip'.  The 'dist' key holds the computed distance to the user.
     """
-    weights = BIOTIPO_WEIGHTS.get(biotipo, BIOTIPO_WEIGHTS["Retangular"])
-    scored: List[Dict[str, float]] = []
-    for row in SIZE_CHART:
-        db = (user_bust - row["bust"]) * weights["bust"]
-        dw = (user_waist - row["waist"]) * weights["waist"]
-        dh = (user_hip - row["hip"]) * weights["hip"]
-        dist = math.sqrt(db ** 2 + dw ** 2 + dh ** 2)
-        scored.append({
-            "size": row["size"],
-            "dist": dist,
-            "bust": row["bust"],
-            "waist": row["waist"],
-            "hip": row["hip"],
-        })
-    # Sort by ascending distance
-    scored.sort(key=lambda x: x["dist"])
-    return scored
+    dist_sq = _compute_dists_sq(user_bust, user_waist, user_hip, biotipo)
+    return _materialize(np.argsort(dist_sq, kind="stable"), dist_sq)
+
+# Per-thread scratch arrays for the batch path, grown on demand and reused
+# across calls so a steady stream of batches allocates nothing.  Thread-local
+# (mirroring the BytesIO pool in export.py) because Streamlit serves
+# sessions from a thread pool.
+_batch_scratch = threading.local()
+
+def _batch_buffers(n: int, rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(wq (n, 3), diffs (n, rows, 3), out (n, rows))`` scratch views.
+
+    ``rows`` is the reference-table length the caller scores against –
+    the 15-row chart today, but the buffers grow with whatever table is
+    passed.  Capacity never shrinks, so alternating batch shapes do not
+    thrash reallocations.
+    """
+    bufs = getattr(_batch_scratch, "bufs", None)
+    if bufs is None or bufs[0].shape[0] < n or bufs[1].shape[1] < rows:
+        cap_n = n if bufs is None else max(n, bufs[0].shape[0])
+        cap_rows = rows if bufs is None else max(rows, bufs[1].shape[1])
+        bufs = (
+            np.empty((cap_n, 3), dtype=np.float32),
+            np.empty((cap_n, cap_rows, 3), dtype=np.float32),
+            np.empty((cap_n, cap_rows), dtype=np.float32),
+        )
+        _batch_scratch.bufs = bufs
+    return bufs[0][:n], bufs[1][:n, :rows], bufs[2][:n, :rows]
+
+# Below this many reference rows, the per-call overhead of handing work to
+# simsimd outweighs its SIMD kernels; the 15-row chart stays on NumPy.
+_SIMSIMD_MIN_ROWS = 32
+
+def _l2sq(queries: np.ndarray, refs: np.ndarray) -> np.ndarray:
+    """All-pairs squared L2 distance between query rows and reference rows.
+
+    Runtime dispatcher for the batch path: when simsimd is installed and
+    the reference table is large enough to amortize the dispatch, its
+    hand-vectorized ``cdist`` kernel does the work; otherwise the NumPy
+    broadcast runs through the per-thread scratch buffers.  Both inputs
+    are expected pre-scaled by the biótipo weights, so plain (unweighted)
+    L2 here reproduces the module's weighted metric.
+    """
+    if _HAS_SIMSIMD and refs.shape[0] >= _SIMSIMD_MIN_ROWS:
+        return np.asarray(
+            simsimd.cdist(queries, refs, metric="sqeuclidean"), dtype=np.float32
+        )
+    diffs, out = _batch_buffers(queries.shape[0], refs.shape[0])[1:]
+    np.subtract(queries[:, None, :], refs, out=diffs)
+    np.multiply(diffs, diffs, out=diffs)
+    return diffs.sum(axis=-1, out=out)
+
+def score_sizes_batch(users: np.ndarray, biotipo: str) -> np.ndarray:
+    """Score many users against the chart in one vectorized call.
+
+    The scalar API re-enters Python once per user, which is fine for the
+    interactive form but not for bulk work such as scoring an uploaded CSV
+    of measurements.  Here the whole batch broadcasts against the chart at
+    C level: one multiply to weight the users, one subtraction against the
+    pre-weighted reference matrix and one reduction over the axis of the
+    three measurements.
+
+    Parameters
+    ----------
+    users : np.ndarray
+        Array of shape (N, 3) with one row per user holding bust, waist
+        and hip circumferences in centimetres.
+    biotipo : str
+        Body type name used to select weighting factors, applied to the
+        whole batch.  Unknown values fall back to 'Retangular'.
+
+    Returns
+    -------
+    np.ndarray
+        float32 array of shape (N, 15) holding the squared weighted
+        distance from each user to each chart row, in chart order.  Row
+        ``j`` corresponds to ``SIZE_CHART[j]``; ``argmin(axis=1)`` yields
+        the best chart index per user.  The array is backed by a
+        per-thread scratch buffer that the next call on the same thread
+        reuses – copy it if it must outlive that call.
+    """
+    precomp_batch = _tables().precomp_batch
+    wrefs, weights = precomp_batch.get(biotipo, precomp_batch["Retangular"])
+    # float32 and C-contiguous up front: half the bandwidth of float64 and
+    # the layout every kernel below streams without strided gathers.
+    users = np.ascontiguousarray(users, dtype=np.float32)
+    wq = _batch_buffers(users.shape[0], wrefs.shape[0])[0]
+    np.multiply(users, weights, out=wq)
+    return _l2sq(wq, wrefs)
+
+def suggest_size_and_top_batch(users: np.ndarray, biotipo: str, top_n: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """Batch counterpart of :func:`suggest_size_and_top`.
+
+    Returns arrays rather than per-user dicts so a large batch stays in
+    NumPy end to end; callers that need the dict form for a handful of
+    rows can index ``SIZE_CHART`` with the returned chart indices.
+
+    Parameters
+    ----------
+    users : np.ndarray
+        Array of shape (N, 3); see :func:`score_sizes_batch`.
+    biotipo : str
+        Body type name applied to the whole batch.
+    top_n : int, optional
+        Number of top candidates per user.  Defaults to 3.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        ``(best_sizes, top_idx)`` where ``best_sizes`` has shape (N,) with
+        the suggested numeric size per user and ``top_idx`` has shape
+        (N, top_n) with chart indices ordered by ascending distance.  For
+        ``top_n <= 0`` nothing is selected: the sizes array is empty and
+        ``top_idx`` has shape (N, 0), mirroring the scalar path's
+        ``(None, [])``.
+    """
+    if top_n <= 0:
+        # Degrade like the scalar paths do for non-positive top_n instead
+        # of letting a negative slice select almost the whole chart.
+        n = np.asarray(users).shape[0]
+        return np.empty(0, dtype=np.int16), np.empty((n, 0), dtype=np.intp)
+    dist_sq = score_sizes_batch(users, biotipo)
+    if top_n < dist_sq.shape[1]:
+        idx = np.argpartition(dist_sq, top_n, axis=1)[:, :top_n]
+        # As in the scalar path: put the selected indices back in chart
+        # order so the stable sort breaks exact ties toward smaller sizes.
+        idx.sort(axis=1)
+        order = np.argsort(np.take_along_axis(dist_sq, idx, axis=1),
+                           axis=1, kind="stable")
+        idx = np.take_along_axis(idx, order, axis=1)
+    else:
+        idx = np.argsort(dist_sq, axis=1, kind="stable")
+    return _tables().sizes[idx[:, 0]], idx
+
+# Inclusive integer-centimetre bounds of the precomputed suggestion grid,
+# chosen to cover the chart (sizes 34-62) with a margin on either side.
+_GRID_BUST = (70, 135)
+_GRID_WAIST = (55, 120)
+_GRID_HIP = (75, 140)
+
+@lru_cache(maxsize=None)
+def _best_size_grid(biotipo: str) -> np.ndarray:
+    """Best chart index for every integer (bust, waist, hip) in the grid.
+
+    The suggestion is a pure function of the three measurements and the
+    biótipo, and over the grid above that domain is small enough to
+    enumerate: 66³ combinations per biótipo, one int8 chart index each
+    (~0.3 MB).  Built lazily on first use per biótipo – rather than for
+    all six at import – so cold start only pays for grids that are
+    actually hit.
+    """
+    nb = _GRID_BUST[1] - _GRID_BUST[0] + 1
+    waists = np.arange(_GRID_WAIST[0], _GRID_WAIST[1] + 1, dtype=np.float32)
+    hips = np.arange(_GRID_HIP[0], _GRID_HIP[1] + 1, dtype=np.float32)
+    users = np.empty((waists.size * hips.size, 3), dtype=np.float32)
+    users[:, 1] = np.repeat(waists, hips.size)
+    users[:, 2] = np.tile(hips, waists.size)
+    grid = np.empty((nb, waists.size, hips.size), dtype=np.int8)
+    # One batch-scored slice per bust value keeps the scratch buffers at
+    # waist x hip size instead of materialising the full cube at once.
+    for i in range(nb):
+        users[:, 0] = _GRID_BUST[0] + i
+        dist_sq = score_sizes_batch(users, biotipo)
+        grid[i] = dist_sq.argmin(axis=1).reshape(waists.size, hips.size)
+    return grid
+
+def suggest_size_fast(user_bust: float, user_waist: float, user_hip: float, biotipo: str) -> int:
+    """Return just the suggested numeric size, served from the grid when possible.
+
+    For whole-centimetre measurements inside the precomputed grid this is
+    a single array lookup; anything else (fractional or out-of-range
+    inputs) falls through to the live kernel, so the result always equals
+    ``suggest_size_and_top(...)[0]["size"]``.
+    """
+    b, w, h = int(user_bust), int(user_waist), int(user_hip)
+    if (
+        b == user_bust and w == user_waist and h == user_hip
+        and _GRID_BUST[0] <= b <= _GRID_BUST[1]
+        and _GRID_WAIST[0] <= w <= _GRID_WAIST[1]
+        and _GRID_HIP[0] <= h <= _GRID_HIP[1]
+    ):
+        grid = _best_size_grid(biotipo)
+        return SIZES[grid[b - _GRID_BUST[0], w - _GRID_WAIST[0], h - _GRID_HIP[0]]]
+    best, _ = suggest_size_and_top(user_bust, user_waist, user_hip, biotipo, top_n=1)
+    return int(best["size"])
+
+def _topn_indices(dist_sq: np.ndarray, top_n: int) -> List[int]:
+    """Indices of the ``top_n`` smallest squared distances, ascending.
+
+    For top_n=3 out of 15 rows a full (or even partial) NumPy sort is
+    dominated by its fixed call overhead, so this keeps a small slot list
+    and streams the kernel output through one insertion pass: roughly one
+    compare (and rarely a shift) per chart row.  Equal distances never
+    displace an earlier entry, so ties resolve toward the smaller chart
+    index – the same order the stable sort in score_sizes yields.
+    """
+    if top_n <= 0:
+        return []
+    slots: List[Tuple[float, int]] = []
+    for i, d in enumerate(dist_sq.tolist()):
+        if len(slots) == top_n:
+            if d >= slots[-1][0]:
+                continue
+            slots.pop()
+        j = len(slots)
+        while j > 0 and slots[j - 1][0] > d:
+            j -= 1
+        slots.insert(j, (d, i))
+    return [i for _, i in slots]
 
 def suggest_size_and_top(user_bust: float, user_waist: float, user_hip: float, biotipo: str, top_n: int = 3):
     """Return the best size suggestion and a list of top candidates.
@@ -183,7 +565,50 @@ def suggest_size_and_top(user_bust: float, user_waist: float, user_hip: float, b
         A tuple containing the best-matching size (the first entry of the
         scored list) and a list of the top ``top_n`` candidate sizes.
     """
-    scored = score_sizes(user_bust, user_waist, user_hip, biotipo)
-    best = scored[0] if scored else None
-    top_candidates = scored[:top_n]
+    t = _tables()
+    if _HAS_C_KERNEL and top_n <= 16:
+        wB, wW, wH, wb, ww, wh = t.precomp.get(biotipo, t.precomp["Retangular"])
+        idx, dists = _c_score_and_topn(
+            user_bust, user_waist, user_hip, wb, ww, wh, wB, wW, wH, top_n
+        )
+        top_candidates = []
+        for i, dist in zip(idx, dists):
+            entry = dict(t.row_templates[i])
+            entry["dist"] = dist
+            top_candidates.append(entry)
+        best = top_candidates[0] if top_candidates else None
+        return best, top_candidates
+    dist_sq = _compute_dists_sq(user_bust, user_waist, user_hip, biotipo)
+    # Only the top_n candidates are materialised: a single insertion pass
+    # selects them, instead of ordering (and building dicts for) the
+    # whole chart.
+    top_candidates = _materialize(_topn_indices(dist_sq, top_n), dist_sq)
+    best = top_candidates[0] if top_candidates else None
     return best, top_candidates
+
+def __getattr__(name: str):
+    """PEP 562 access to the derived tables under their historical names.
+
+    The arrays used to be module-level constants; they now live in
+    :func:`_tables` so import stays cheap, but attribute access keeps
+    working for any code that still reaches for them.
+    Unknown names are rejected before :func:`_tables` is called, so
+    failed attribute probes (``hasattr`` checks, star-import machinery)
+    do not trigger the table build this indirection exists to defer.
+    """
+    try:
+        attr = _LAZY_TABLE_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(_tables(), attr)
+
+# Historical module-level name -> _Tables field, for __getattr__ above.
+_LAZY_TABLE_ATTRS: Dict[str, str] = {
+    "_BUST": "bust",
+    "_WAIST": "waist",
+    "_HIP": "hip",
+    "_SIZES": "sizes",
+    "_PRECOMP": "precomp",
+    "_PRECOMP_BATCH": "precomp_batch",
+    "_ROW_TEMPLATES": "row_templates",
+}
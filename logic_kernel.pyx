@@ -0,0 +1,81 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+logic_kernel.pyx
+----------------
+
+Optional C extension holding the end-to-end scalar scoring kernel for
+``logic.suggest_size_and_top``: weighted squared distances over the chart
+plus top-N selection in a single C loop, with no Python frames, temporary
+arrays or sort calls in between.  Built with ``python setup.py
+build_ext --inplace``; ``logic`` falls back to the NumPy implementation
+when the extension is absent, so building it is purely an optimization.
+
+The buffers arrive as float32 memoryviews over the pre-weighted chart
+columns from ``logic._tables()`` (the module's structure-of-arrays
+layout), so the arithmetic here matches the NumPy and numba kernels
+operation for operation.
+"""
+
+from libc.math cimport sqrt
+
+# Upper bound on top_n the stack-allocated selection buffers support; the
+# chart has 15 rows, so this is never the limiting factor in practice.
+cdef enum:
+    MAX_TOP = 16
+
+
+cpdef tuple score_and_topn(float ub, float uw, float uh,
+                           float wb, float ww, float wh,
+                           const float[::1] wbust, const float[::1] wwaist,
+                           const float[::1] whip, int top_n):
+    """Return ``(indices, dists)`` of the ``top_n`` closest chart rows.
+
+    ``indices`` are chart positions in ascending order of squared weighted
+    distance (ties resolve toward the smaller index, i.e. the smaller
+    size) and ``dists`` the matching true Euclidean distances.  The
+    reference columns arrive pre-multiplied by the weights, so only the
+    user side is scaled here.  Selection is a fixed-size insertion sort:
+    for top_n=3 over 15 rows that is one pass of compare-and-shift, with
+    no heap or full sort.
+    """
+    cdef int n = wbust.shape[0]
+    cdef float best_d[MAX_TOP]
+    cdef int best_i[MAX_TOP]
+    cdef int filled = 0
+    cdef int i, j
+    cdef float db, dw, dh, d
+
+    if top_n <= 0:
+        # Without this the selection loop would index best_d[top_n - 1],
+        # an out-of-bounds access on the stack arrays with boundscheck off.
+        return [], []
+    if top_n > n:
+        top_n = n
+    if top_n > MAX_TOP:
+        raise ValueError(f"top_n may be at most {MAX_TOP}, got {top_n}")
+
+    for i in range(n):
+        db = ub * wb - wbust[i]
+        dw = uw * ww - wwaist[i]
+        dh = uh * wh - whip[i]
+        d = db * db + dw * dw + dh * dh
+        if filled < top_n:
+            j = filled
+            filled += 1
+        elif d < best_d[top_n - 1]:
+            j = top_n - 1
+        else:
+            continue
+        # Shift strictly-larger entries right; equal distances stay put,
+        # so earlier (smaller) chart indices win ties.
+        while j > 0 and best_d[j - 1] > d:
+            best_d[j] = best_d[j - 1]
+            best_i[j] = best_i[j - 1]
+            j -= 1
+        best_d[j] = d
+        best_i[j] = i
+
+    return (
+        [best_i[j] for j in range(filled)],
+        [sqrt(best_d[j]) for j in range(filled)],
+    )
@@ -0,0 +1,17 @@
+"""
+Build script for the optional Cython scoring kernel.
+
+The app runs fine without it; compiling the extension just removes the
+interpreter from the per-request scoring path:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="guia-tabela-medidas-kernel",
+    ext_modules=cythonize("logic_kernel.pyx"),
+)
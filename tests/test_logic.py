@@ -5,7 +5,24 @@ distances and that increasing all measurements results in a suggested size
 that is the same or larger.
 """
 
-from logic import score_sizes, suggest_size_and_top
+from logic import (
+    classify_estatura,
+    score_sizes,
+    suggest_size_and_top,
+    suggest_size_and_top_batch,
+    suggest_size_fast,
+)
+
+
+def test_classify_estatura_bins_and_edges():
+    """Bin membership, the gaps between bins and out-of-range heights."""
+    assert classify_estatura(140) == "baixa"   # below the lowest bin
+    assert classify_estatura(157) == "baixa"
+    assert classify_estatura(157.5) == "média"  # gap between bins
+    assert classify_estatura(160) == "média"
+    assert classify_estatura(165.5) == "média"  # gap between bins
+    assert classify_estatura(166) == "alta"
+    assert classify_estatura(190) == "alta"    # above the highest bin
 
 def test_scores_are_sorted():
     """The scores returned should be sorted by ascending distance."""
@@ -23,3 +40,22 @@ def test_size_increases_with_measurements():
     assert best_big["size"] >= best_small["size"], (
         f"Expected larger measurements to yield same or larger size; got {best_small['size']} and {best_big['size']}"
     )
+
+
+def test_batch_matches_scalar():
+    """The batch API should agree with the scalar API row by row."""
+    import numpy as np
+
+    users = np.array([[90, 74, 98], [110, 94, 118], [82, 66, 90]], dtype=np.float32)
+    best_sizes, top_idx = suggest_size_and_top_batch(users, "Violão")
+    for row, best_batch, idx in zip(users, best_sizes, top_idx):
+        best, top3 = suggest_size_and_top(*row, biotipo="Violão")
+        assert best_batch == best["size"]
+        assert [entry["size"] for entry in top3] == [34 + 2 * int(i) for i in idx]
+
+
+def test_fast_lookup_matches_live_kernel():
+    """Grid-served suggestions must equal the live kernel's best size."""
+    for measurements in [(90, 74, 98), (70, 55, 75), (135, 120, 140), (90.5, 74, 98)]:
+        best, _ = suggest_size_and_top(*measurements, biotipo="Ampulheta")
+        assert suggest_size_fast(*measurements, biotipo="Ampulheta") == best["size"]